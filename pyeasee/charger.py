@@ -1,9 +1,11 @@
+import heapq
 import logging
 from datetime import datetime
+from json import dumps
 from typing import Any, Dict, Union
 
 from .exceptions import NotFoundException
-from .utils import BaseDict
+from .utils import BaseDict, convert_iso8601
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,66 +43,119 @@ REASON_FOR_NO_CURRENT = {
     55: "Pending auth",
 }
 
+_ACCESS_MAP = {
+    1: 1,
+    2: 2,
+    3: 3,
+    "open_for_all": 1,
+    "easee_account_required": 2,
+    "whitelist": 3,
+}
+
+_REASON_STR_NONE = f"(None) {REASON_FOR_NO_CURRENT[None]}"
+_REASON_STR = tuple(
+    f"({i}) {REASON_FOR_NO_CURRENT.get(i, 'Unknown')}"
+    for i in range(max(k for k in REASON_FOR_NO_CURRENT if k is not None) + 1)
+)
+
+_SCHEDULE_KEYS = ("id", "chargeStartTime", "chargeStopTime", "repeat")
+_SESSION_KEYS = ("carConnected", "carDisconnected")
+
+
+def _bool_setting_bodies(key: str):
+    return {value: dumps({key: value}).encode() for value in (True, False)}
+
+
+# Pre-serialized request bodies for boolean charger settings
+_BODY_ENABLED = _bool_setting_bodies("enabled")
+_BODY_ENABLE_IDLE_CURRENT = _bool_setting_bodies("enableIdleCurrent")
+_BODY_LIMIT_TO_SINGLE_PHASE_CHARGING = _bool_setting_bodies("limitToSinglePhaseCharging")
+_BODY_LOCK_CABLE_PERMANENTLY = _bool_setting_bodies("lockCablePermanently")
+_BODY_SMART_BUTTON_ENABLED = _bool_setting_bodies("smartButtonEnabled")
+_BODY_SMART_CHARGING = _bool_setting_bodies("smartCharging")
+
+
+def _session_connected(session: Dict[str, Any]):
+    """ Sort key for raw sessions, compares carConnected the same way ChargerSession returns it """
+    return convert_iso8601(session.get("carConnected"))
+
 
 class ChargerState(BaseDict):
     """ Charger state with integer enum values converted to human readable string values"""
 
+    __slots__ = ()
+
     def __init__(self, state: Dict[str, Any], raw=False):
         if not raw:
-            data = {
-                **state,
-                "chargerOpMode": STATUS[state["chargerOpMode"]],
-                "reasonForNoCurrent": f"({state['reasonForNoCurrent']}) {REASON_FOR_NO_CURRENT.get(state['reasonForNoCurrent'], 'Unknown')}",
-            }
+            reason = state["reasonForNoCurrent"]
+            if reason is None:
+                reason_str = _REASON_STR_NONE
+            elif isinstance(reason, int) and 0 <= reason < len(_REASON_STR):
+                reason_str = _REASON_STR[reason]
+            else:
+                reason_str = f"({reason}) {REASON_FOR_NO_CURRENT.get(reason, 'Unknown')}"
+            data = state.copy()
+            data["chargerOpMode"] = STATUS[state["chargerOpMode"]]
+            data["reasonForNoCurrent"] = reason_str
         else:
-            data = {
-                **state,
-                "reasonForNoCurrent": "none" if state["reasonForNoCurrent"] is None else state["reasonForNoCurrent"],
-            }
+            data = state.copy()
+            if state["reasonForNoCurrent"] is None:
+                data["reasonForNoCurrent"] = "none"
         super().__init__(data)
 
 
 class ChargerConfig(BaseDict):
     """ Charger config with integer enum values converted to human readable string values"""
 
+    __slots__ = ()
+
     def __init__(self, config: Dict[str, Any], raw=False):
+        data = config.copy()
         if not raw:
-            data = {
-                **config,
-                "localNodeType": NODE_TYPE[config["localNodeType"]],
-                "phaseMode": PHASE_MODE[config["phaseMode"]],
-            }
-        else:
-            data = {**config}
+            data["localNodeType"] = NODE_TYPE[config["localNodeType"]]
+            data["phaseMode"] = PHASE_MODE[config["phaseMode"]]
         super().__init__(data)
 
 
 class ChargerSchedule(BaseDict):
     """ Charger charging schedule/plan """
 
+    __slots__ = ()
+
     def __init__(self, schedule: Dict[str, Any]):
-        data = {
-            "id": schedule.get("id"),
-            "chargeStartTime": schedule.get("chargeStartTime"),
-            "chargeStopTime": schedule.get("chargeStopTime"),
-            "repeat": schedule.get("repeat"),
-        }
-        super().__init__(data)
+        super().__init__({k: schedule.get(k) for k in _SCHEDULE_KEYS})
 
 
 class ChargerSession(BaseDict):
     """ Charger charging session """
 
+    __slots__ = ()
+
     def __init__(self, session: Dict[str, Any]):
-        data = {
-            "carConnected": session.get("carConnected"),
-            "carDisconnected": session.get("carDisconnected"),
-            "kiloWattHours": float(session.get("kiloWattHours")),
-        }
+        kwh = session.get("kiloWattHours")
+        if type(kwh) is not float:
+            kwh = 0.0 if kwh is None else float(kwh)
+        data = {k: session.get(k) for k in _SESSION_KEYS}
+        data["kiloWattHours"] = kwh
         super().__init__(data)
 
 
 class Charger(BaseDict):
+    __slots__ = (
+        "id",
+        "name",
+        "site",
+        "circuit",
+        "easee",
+        "_settings_url",
+        "_cmd",
+        "_state_url",
+        "_config_url",
+        "_basic_plan_url",
+        "_access_url",
+        "_sessions_prefix",
+    )
+
     def __init__(self, entries: Dict[str, Any], easee: Any, site: Any = None, circuit: Any = None):
         super().__init__(entries)
         self.id: str = entries["id"]
@@ -108,61 +163,75 @@ class Charger(BaseDict):
         self.site = site
         self.circuit = circuit
         self.easee = easee
+        base = f"/api/chargers/{entries['id']}"
+        self._settings_url = base + "/settings"
+        self._cmd = base + "/commands/"
+        self._state_url = base + "/state"
+        self._config_url = base + "/config"
+        self._basic_plan_url = base + "/basic_charge_plan"
+        self._access_url = base + "/access"
+        self._sessions_prefix = f"/api/sessions/charger/{entries['id']}"
+
+    async def _post_bool_setting(self, key: str, bodies: Dict[bool, bytes], enable: bool):
+        """ Post a boolean setting, using the pre-serialized body for real bools """
+        if type(enable) is bool:
+            return await self.easee.post(self._settings_url, data=bodies[enable])
+        return await self.easee.post(self._settings_url, json={key: enable})
 
     async def get_consumption_between_dates(self, from_date: datetime, to_date):
         """ Gets consumption between two dates """
-        value = await (
-            await self.easee.get(f"/api/sessions/charger/{self.id}/total/{from_date.isoformat()}/{to_date.isoformat()}")
-        ).text()
+        value = await self.easee.get_text(
+            self._sessions_prefix + "/total/" + from_date.isoformat() + "/" + to_date.isoformat()
+        )
         return float(value)
 
-    async def get_sessions_between_dates(self, from_date: datetime, to_date):
-        """ Gets charging sessions between two dates """
-        sessions = await (
-            await self.easee.get(
-                f"/api/sessions/charger/{self.id}/sessions/{from_date.isoformat()}/{to_date.isoformat()}"
-            )
-        ).json()
-        sessions = [ChargerSession(session) for session in sessions]
-        sessions.sort(key=lambda x: x["carConnected"], reverse=True)
+    async def get_sessions_between_dates(self, from_date: datetime, to_date, limit: int = None):
+        """ Gets charging sessions between two dates, latest first, optionally only the latest limit sessions """
+        sessions = await self.easee.get_json(
+            self._sessions_prefix + "/sessions/" + from_date.isoformat() + "/" + to_date.isoformat()
+        )
+        # Sort the raw records so each timestamp is parsed once by the sort key, not per wrapper lookup
+        if limit is not None:
+            sessions = heapq.nlargest(limit, sessions, key=_session_connected)
+        else:
+            sessions.sort(key=_session_connected, reverse=True)
 
-        return sessions
+        return [ChargerSession(session) for session in sessions]
 
     async def get_config(self, from_cache=False, raw=False) -> ChargerConfig:
         """ get config for charger """
-        config = await (await self.easee.get(f"/api/chargers/{self.id}/config")).json()
+        config = await self.easee.get_json(self._config_url)
         return ChargerConfig(config, raw)
 
     async def get_state(self, raw=False) -> ChargerState:
         """ get state for charger """
-        state = await (await self.easee.get(f"/api/chargers/{self.id}/state")).json()
+        state = await self.easee.get_json(self._state_url)
         return ChargerState(state, raw)
 
     async def start(self):
         """Start charging session"""
-        return await self.easee.post(f"/api/chargers/{self.id}/commands/start_charging")
+        return await self.easee.post(self._cmd + "start_charging")
 
     async def pause(self):
         """Pause charging session"""
-        return await self.easee.post(f"/api/chargers/{self.id}/commands/pause_charging")
+        return await self.easee.post(self._cmd + "pause_charging")
 
     async def resume(self):
         """Resume charging session"""
-        return await self.easee.post(f"/api/chargers/{self.id}/commands/resume_charging")
+        return await self.easee.post(self._cmd + "resume_charging")
 
     async def stop(self):
         """Stop charging session"""
-        return await self.easee.post(f"/api/chargers/{self.id}/commands/stop_charging")
+        return await self.easee.post(self._cmd + "stop_charging")
 
     async def toggle(self):
         """Toggle charging session start/stop/pause/resume """
-        return await self.easee.post(f"/api/chargers/{self.id}/commands/toggle_charging")
+        return await self.easee.post(self._cmd + "toggle_charging")
 
     async def get_basic_charge_plan(self) -> ChargerSchedule:
         """Get and return charger basic charge plan setting from cloud """
         try:
-            plan = await self.easee.get(f"/api/chargers/{self.id}/basic_charge_plan")
-            plan = await plan.json()
+            plan = await self.easee.get_json(self._basic_plan_url)
             _LOGGER.debug(plan)
             return ChargerSchedule(plan)
         except (NotFoundException):
@@ -178,58 +247,52 @@ class Charger(BaseDict):
             "chargeStopTime": str(chargeStopTime),
             "repeat": repeat,
         }
-        return await self.easee.post(f"/api/chargers/{self.id}/basic_charge_plan", json=json)
+        return await self.easee.post(self._basic_plan_url, json=json)
 
     async def enable_charger(self, enable: bool):
         """Enable and disable charger in charger settings """
-        json = {"enabled": enable}
-        return await self.easee.post(f"/api/chargers/{self.id}/settings", json=json)
+        return await self._post_bool_setting("enabled", _BODY_ENABLED, enable)
 
     async def enable_idle_current(self, enable: bool):
         """Enable and disable idle current in charger settings """
-        json = {"enableIdleCurrent": enable}
-        return await self.easee.post(f"/api/chargers/{self.id}/settings", json=json)
+        return await self._post_bool_setting("enableIdleCurrent", _BODY_ENABLE_IDLE_CURRENT, enable)
 
     async def limitToSinglePhaseCharging(self, enable: bool):
         """Limit to single phase charging in charger settings """
-        json = {"limitToSinglePhaseCharging": enable}
-        return await self.easee.post(f"/api/chargers/{self.id}/settings", json=json)
+        return await self._post_bool_setting("limitToSinglePhaseCharging", _BODY_LIMIT_TO_SINGLE_PHASE_CHARGING, enable)
 
     async def phaseMode(self, mode: int = 2):
         """Set charging phase mode, 1 = always 1-phase, 2 = auto, 3 = always 3-phase """
         json = {"phaseMode": mode}
-        return await self.easee.post(f"/api/chargers/{self.id}/settings", json=json)
+        return await self.easee.post(self._settings_url, json=json)
 
     async def lockCablePermanently(self, enable: bool):
         """Lock and unlock cable permanently in charger settings """
-        json = {"lockCablePermanently": enable}
-        return await self.easee.post(f"/api/chargers/{self.id}/settings", json=json)
+        return await self._post_bool_setting("lockCablePermanently", _BODY_LOCK_CABLE_PERMANENTLY, enable)
 
     async def smartButtonEnabled(self, enable: bool):
         """Enable and disable smart button in charger settings """
-        json = {"smartButtonEnabled": enable}
-        return await self.easee.post(f"/api/chargers/{self.id}/settings", json=json)
+        return await self._post_bool_setting("smartButtonEnabled", _BODY_SMART_BUTTON_ENABLED, enable)
 
     async def delete_basic_charge_plan(self):
         """Delete charger basic charge plan setting from cloud """
-        return await self.easee.delete(f"/api/chargers/{self.id}/basic_charge_plan")
+        return await self.easee.delete(self._basic_plan_url)
 
     async def override_schedule(self):
         """Override scheduled charging and start charging"""
-        return await self.easee.post(f"/api/chargers/{self.id}/commands/override_schedule")
+        return await self.easee.post(self._cmd + "override_schedule")
 
     async def smart_charging(self, enable: bool):
         """Set charger smart charging setting"""
-        json = {"smartCharging": enable}
-        return await self.easee.post(f"/api/chargers/{self.id}/settings", json=json)
+        return await self._post_bool_setting("smartCharging", _BODY_SMART_CHARGING, enable)
 
     async def reboot(self):
         """Reboot charger"""
-        return await self.easee.post(f"/api/chargers/{self.id}/commands/reboot")
+        return await self.easee.post(self._cmd + "reboot")
 
     async def update_firmware(self):
         """Update charger firmware"""
-        return await self.easee.post(f"/api/chargers/{self.id}/commands/update_firmware")
+        return await self.easee.post(self._cmd + "update_firmware")
 
     async def set_dynamic_charger_circuit_current(self, currentP1: int, currentP2: int = None, currentP3: int = None):
         """ Set circuit dynamic current for charger """
@@ -257,26 +320,17 @@ class Charger(BaseDict):
     async def set_dynamic_charger_current(self, current: int):
         """ Set charger dynamic current """
         json = {"dynamicChargerCurrent": current}
-        return await self.easee.post(f"/api/chargers/{self.id}/settings", json=json)
+        return await self.easee.post(self._settings_url, json=json)
 
     async def set_max_charger_current(self, current: int):
         """ Set charger max current """
         json = {"maxChargerCurrent": current}
-        return await self.easee.post(f"/api/chargers/{self.id}/settings", json=json)
+        return await self.easee.post(self._settings_url, json=json)
 
     async def set_access(self, access: Union[int, str]):
         """ Set the level of access for a changer """
-        json = {
-            1: 1,
-            2: 2,
-            3: 3,
-            "open_for_all": 1,
-            "easee_account_required": 2,
-            "whitelist": 3,
-        }
-
-        return await self.easee.put(f"/api/chargers/{self.id}/access", json=json[access])
+        return await self.easee.put(self._access_url, json=_ACCESS_MAP[access])
 
     async def delete_access(self):
         """ Revert permissions overridden on a charger level"""
-        return await self.easee.delete(f"/api/chargers/{self.id}/access")
+        return await self.easee.delete(self._access_url)
@@ -128,6 +128,16 @@ class Easee:
         await self.check_status(response)
         return response
 
+    async def get_json(self, url, **kwargs):
+        """ GET url and return the decoded JSON body """
+        response = await self.get(url, **kwargs)
+        return await response.json()
+
+    async def get_text(self, url, **kwargs):
+        """ GET url and return the body as text """
+        response = await self.get(url, **kwargs)
+        return await response.text()
+
     async def delete(self, url, **kwargs):
         _LOGGER.debug("DELETE: %s (%s)", url, kwargs)
         await self._verify_updated_token()
@@ -377,36 +387,36 @@ class Easee:
         """
         Retrieve all chargers
         """
-        records = await (await self.get("/api/chargers")).json()
+        records = await self.get_json("/api/chargers")
         _LOGGER.debug("Chargers:  %s", records)
         return [Charger(k, self) for k in records]
 
     async def get_site(self, id: int) -> Site:
         """ get site by id """
-        data = await (await self.get(f"/api/sites/{id}?detailed=true")).json()
+        data = await self.get_json(f"/api/sites/{id}?detailed=true")
         _LOGGER.debug("Site:  %s", data)
         return Site(data, self)
 
     async def get_sites(self) -> List[Site]:
         """ Get all sites """
-        records = await (await self.get("/api/sites")).json()
+        records = await self.get_json("/api/sites")
         _LOGGER.debug("Sites:  %s", records)
         sites = await asyncio.gather(*[self.get_site(r["id"]) for r in records])
         return sites
 
     async def get_site_state(self, id: str) -> SiteState:
         """ Get site state """
-        state = await (await self.get(f"/api/sites/{id}/state")).json()
+        state = await self.get_json(f"/api/sites/{id}/state")
         return SiteState(state)
 
     async def get_active_countries(self) -> List[Any]:
         """ Get all active countries """
-        records = await (await self.get("/api/resources/countries/active")).json()
+        records = await self.get_json("/api/resources/countries/active")
         _LOGGER.debug("Active countries:  %s", records)
         return records
 
     async def get_currencies(self) -> List[Any]:
         """ Get all currencies """
-        records = await (await self.get("/api/resources/currencies")).json()
+        records = await self.get_json("/api/resources/currencies")
         _LOGGER.debug("Currencies:  %s", records)
         return records
@@ -29,12 +29,12 @@ class Equalizer(BaseDict):
 
     async def get_state(self):
         """ Get Equalizer state """
-        state = await (await self.easee.get(f"/api/equalizers/{self.id}/state")).json()
+        state = await self.easee.get_json(f"/api/equalizers/{self.id}/state")
         return EqualizerState(state)
 
     async def get_config(self):
         """ Get Equalizer config """
-        config = await (await self.easee.get(f"/api/equalizers/{self.id}/config")).json()
+        config = await self.easee.get_json(f"/api/equalizers/{self.id}/config")
         return EqualizerConfig(config)
 
 
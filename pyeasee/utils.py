@@ -46,20 +46,28 @@ def validate_iso8601(str_val):
     return False
 
 
+def convert_iso8601(value):
+    """ Convert ISO 8601 date strings to UTC datetimes, other values are returned as is """
+    if type(value) is str and validate_iso8601(value):
+        try:
+            return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+        except ValueError:
+            try:
+                return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+            except ValueError:
+                return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+    return value
+
+
 class BaseDict(Mapping):
+    # Subclasses should declare __slots__ as well to avoid a per-instance __dict__
+    __slots__ = ("_storage",)
+
     def __init__(self, entries):
         self._storage = entries
 
     def __getitem__(self, key):
-        if type(self._storage[key]) == str and validate_iso8601(self._storage[key]):
-            try:
-                return datetime.fromisoformat(self._storage[key]).replace(tzinfo=timezone.utc)
-            except ValueError:
-                try:
-                    return datetime.strptime(self._storage[key], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-                except ValueError:
-                    return datetime.strptime(self._storage[key], "%Y-%m-%dT%H:%M:%S.000Z").replace(tzinfo=timezone.utc)
-        return self._storage[key]
+        return convert_iso8601(self._storage[key])
 
     def __setitem__(self, key, value):
         self._storage[key] = value
@@ -25,3 +25,9 @@ def test_iso_datestring_defaults_to_utc():
     bd = BaseDict({"date": "2020-07-18T07:02:45Z"})
     date = bd.get("date")
     assert date.tzname() == "UTC"
+
+
+def test_parse_iso_date_with_fractional_seconds_and_z():
+    bd = BaseDict({"date": "2020-07-01T10:00:00.500Z"})
+    date = bd.get("date")
+    assert date == datetime.datetime(2020, 7, 1, 10, 0, 0, 500000, tzinfo=datetime.timezone.utc)
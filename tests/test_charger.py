@@ -1,5 +1,9 @@
+import json
+import pickle
 import pytest
+from datetime import datetime
 from pyeasee import Charger
+from pyeasee.charger import ChargerConfig, ChargerSession, ChargerState
 
 
 class MockResponse:
@@ -16,11 +20,15 @@ class MockEasee:
         self.post_data = post_data
 
     async def post(self, url, **kwargs):
+        self.posted = (url, kwargs)
         return MockResponse(self.post_data)
 
     async def get(self, url, **kwargs):
         return MockResponse(self.get_data)
 
+    async def get_json(self, url, **kwargs):
+        return self.get_data
+
 
 default_state = {
     "smartCharging": False,
@@ -98,6 +106,14 @@ default_config = {
     "ledStripBrightness": None,
 }
 
+# Mixes timestamps with and without fractional seconds, the API returns both
+default_sessions = [
+    {"carConnected": "2020-07-01T10:00:00Z", "carDisconnected": "2020-07-01T12:00:00Z", "kiloWattHours": 1.5},
+    {"carConnected": "2020-07-03T10:00:00Z", "carDisconnected": "2020-07-03T12:00:00Z", "kiloWattHours": 3.5},
+    {"carConnected": "2020-07-02T10:00:00Z", "carDisconnected": "2020-07-02T12:00:00Z", "kiloWattHours": 2.5},
+    {"carConnected": "2020-07-03T10:00:00.500Z", "carDisconnected": "2020-07-03T12:00:00Z", "kiloWattHours": 4.5},
+]
+
 
 @pytest.mark.asyncio
 async def test_get_correct_status():
@@ -113,3 +129,145 @@ async def test_get_correct_phase_mode():
     charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, mock_easee)
     state = await charger.get_config()
     assert state["phaseMode"] == "Locked to three phase"
+
+
+def test_raw_config_does_not_alias_source():
+    source = dict(default_config)
+    config = ChargerConfig(source, raw=True)
+    config["phaseMode"] = 1
+    assert source["phaseMode"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_correct_reason_for_no_current():
+    mock_easee = MockEasee(get_data=default_state)
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, mock_easee)
+    state = await charger.get_state()
+    assert state["chargerOpMode"] == "CHARGING"
+    assert state["reasonForNoCurrent"] == "(50) Secondary unit not requesting current or no car connected"
+
+
+@pytest.mark.parametrize(
+    "reason, expected",
+    [
+        (None, "(None) No reason"),
+        (7, "(7) Unknown"),
+        (-1, "(-1) Unknown"),
+        ("50", "(50) Unknown"),
+        (50.0, "(50.0) Secondary unit not requesting current or no car connected"),
+    ],
+)
+def test_reason_for_no_current_strings(reason, expected):
+    state = ChargerState({**default_state, "reasonForNoCurrent": reason})
+    assert state["reasonForNoCurrent"] == expected
+
+
+@pytest.mark.parametrize("op_mode", [-1, 7, None])
+def test_unknown_op_mode_raises_key_error(op_mode):
+    with pytest.raises(KeyError):
+        ChargerState({**default_state, "chargerOpMode": op_mode})
+
+
+@pytest.mark.asyncio
+async def test_get_sessions_sorted_latest_first():
+    mock_easee = MockEasee(get_data=list(default_sessions))
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, mock_easee)
+    sessions = await charger.get_sessions_between_dates(datetime(2020, 7, 1), datetime(2020, 7, 4))
+    assert [s["kiloWattHours"] for s in sessions] == [4.5, 3.5, 2.5, 1.5]
+
+
+@pytest.mark.asyncio
+async def test_get_sessions_sorted_with_mixed_precision_timestamps():
+    sessions_data = [
+        {"carConnected": "2020-07-01T10:00:00Z", "carDisconnected": None, "kiloWattHours": 1.0},
+        {"carConnected": "2020-07-01T10:00:00.500Z", "carDisconnected": None, "kiloWattHours": 2.0},
+    ]
+    mock_easee = MockEasee(get_data=sessions_data)
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, mock_easee)
+    sessions = await charger.get_sessions_between_dates(datetime(2020, 7, 1), datetime(2020, 7, 2))
+    assert [s["kiloWattHours"] for s in sessions] == [2.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_get_sessions_without_car_connected():
+    mock_easee = MockEasee(get_data=[{"carDisconnected": None, "kiloWattHours": 1.0}])
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, mock_easee)
+    sessions = await charger.get_sessions_between_dates(datetime(2020, 7, 1), datetime(2020, 7, 2))
+    assert sessions[0]["carConnected"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_sessions_limit():
+    mock_easee = MockEasee(get_data=list(default_sessions))
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, mock_easee)
+    sessions = await charger.get_sessions_between_dates(datetime(2020, 7, 1), datetime(2020, 7, 4), limit=2)
+    assert [s["kiloWattHours"] for s in sessions] == [4.5, 3.5]
+
+
+class MockCircuit:
+    def __init__(self):
+        self.dynamic_current = None
+
+    async def set_dynamic_current(self, currentP1, currentP2=None, currentP3=None):
+        self.dynamic_current = (currentP1, currentP2, currentP3)
+
+    async def set_max_current(self, currentP1, currentP2=None, currentP3=None):
+        pass
+
+    async def set_max_offline_current(self, currentP1, currentP2=None, currentP3=None):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_set_dynamic_charger_circuit_current():
+    circuit = MockCircuit()
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, MockEasee(), circuit=circuit)
+    await charger.set_dynamic_charger_circuit_current(16, 10, 10)
+    assert circuit.dynamic_current == (16, 10, 10)
+
+
+@pytest.mark.asyncio
+async def test_set_dynamic_charger_circuit_current_with_circuit_assigned_later():
+    circuit = MockCircuit()
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, MockEasee())
+    charger.circuit = circuit
+    await charger.set_dynamic_charger_circuit_current(16)
+    assert circuit.dynamic_current == (16, None, None)
+
+
+@pytest.mark.asyncio
+async def test_set_dynamic_charger_circuit_current_without_circuit():
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, MockEasee())
+    assert await charger.set_dynamic_charger_circuit_current(16) is None
+
+
+def test_session_kilowatthours_defaults_to_zero():
+    session = ChargerSession({"carConnected": "2020-07-01T10:00:00Z", "carDisconnected": None, "kiloWattHours": None})
+    assert session["kiloWattHours"] == 0.0
+    session = ChargerSession({"carConnected": "2020-07-01T10:00:00Z", "carDisconnected": None, "kiloWattHours": 3})
+    assert type(session["kiloWattHours"]) is float
+
+
+@pytest.mark.asyncio
+async def test_enable_charger_posts_json_body():
+    mock_easee = MockEasee()
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, mock_easee)
+    await charger.enable_charger(False)
+    url, kwargs = mock_easee.posted
+    assert url == "/api/chargers/EH123456/settings"
+    assert json.loads(kwargs["data"]) == {"enabled": False}
+
+
+@pytest.mark.asyncio
+async def test_enable_charger_posts_non_bool_as_json():
+    mock_easee = MockEasee()
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, mock_easee)
+    await charger.enable_charger(None)
+    url, kwargs = mock_easee.posted
+    assert url == "/api/chargers/EH123456/settings"
+    assert kwargs == {"json": {"enabled": None}}
+
+
+def test_charger_can_be_pickled():
+    charger = Charger({"id": "EH123456", "name": "Easee Home 12345"}, None)
+    assert pickle.loads(pickle.dumps(charger)).id == "EH123456"